@@ -3,38 +3,267 @@ import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import random
+import heapq
+import itertools
+import json
+from collections import deque
 from datetime import datetime
 
+FDDI_MAX_FRAME_SIZE = 4500
+FDDI_FRAME_OVERHEAD = 28
+FDDI_MAX_PAYLOAD = FDDI_MAX_FRAME_SIZE - FDDI_FRAME_OVERHEAD
+FDDI_TOKEN_SIZE = 11
+BUFFER_SIZE_CLASSES = (64, 512, FDDI_MAX_PAYLOAD)
+MESSAGE_HISTORY = 20
+LOG_HISTORY = 1000
+DEFAULT_BANDWIDTH = 100_000_000
+DEFAULT_PROPAGATION_DELAY = 5e-6
+DEFAULT_BRIDGE_DELAY = 1e-3
+
+HOOK_EVENTS = ("token_received", "token_passed", "transmit", "deliver", "enqueue",
+               "failure", "recovery", "log", "update")
+
+class HookProfiler:
+    def __init__(self):
+        self.stats = {}
+
+    def wrap(self, event, callback):
+        record = self.stats.setdefault((event, id(callback)), [callback, 0, 0.0])
+        perf_counter = time.perf_counter
+
+        def timed(*args):
+            start = perf_counter()
+            try:
+                return callback(*args)
+            finally:
+                record[1] += 1
+                record[2] += perf_counter() - start
+        return timed
+
+    def report(self):
+        rows = [{'event': event,
+                 'hook': getattr(callback, "__qualname__", repr(callback)),
+                 'calls': calls, 'total': total,
+                 'mean': total / calls if calls else 0.0}
+                for (event, _), (callback, calls, total) in self.stats.items()]
+        rows.sort(key=lambda row: row['total'], reverse=True)
+        return rows
+
+    def reset(self):
+        for record in self.stats.values():
+            record[1] = 0
+            record[2] = 0.0
+
+class BufferPool:
+    def __init__(self, size_classes=BUFFER_SIZE_CLASSES, initial_buffers=64):
+        self.size_classes = tuple(sorted(size_classes))
+        self.initial_buffers = initial_buffers
+        self._free = {size: deque() for size in self.size_classes}
+        self._allocated = dict.fromkeys(self.size_classes, 0)
+        self._lock = threading.Lock()
+        for size in self.size_classes:
+            self._grow(size, initial_buffers)
+
+    def _grow(self, size, count):
+        slab = memoryview(bytearray(size * count))
+        self._free[size].extend(slab[i * size:(i + 1) * size] for i in range(count))
+        self._allocated[size] += count
+
+    def _size_class(self, length):
+        for size in self.size_classes:
+            if length <= size:
+                return size
+        raise ValueError(f"Buffer de {length} bytes excede o maior tamanho do pool")
+
+    def acquire(self, length=FDDI_MAX_PAYLOAD):
+        size = self._size_class(length)
+        with self._lock:
+            free = self._free[size]
+            if not free:
+                self._grow(size, max(self.initial_buffers, self._allocated[size]))
+            return free.pop()
+
+    def acquire_many(self, lengths):
+        sizes = [self._size_class(length) for length in lengths]
+        buffers = []
+        with self._lock:
+            for size in sizes:
+                free = self._free[size]
+                if not free:
+                    self._grow(size, max(self.initial_buffers, self._allocated[size]))
+                buffers.append(free.pop())
+        return buffers
+
+    def release(self, buffer):
+        with self._lock:
+            self._free[len(buffer)].append(buffer)
+
+    @property
+    def allocated(self):
+        return sum(self._allocated.values())
+
+    def available(self):
+        return sum(len(free) for free in self._free.values())
+
+class Frame:
+    __slots__ = ('source', 'destination', 'buffer', 'length', 'label', 'enqueued_at',
+                 'final', 'created_at')
+
+    def __init__(self, source, destination, buffer, length, label, enqueued_at=0.0,
+                 final=None, created_at=None):
+        self.source = source
+        self.destination = destination
+        self.buffer = buffer
+        self.length = length
+        self.label = label
+        self.enqueued_at = enqueued_at
+        self.final = final
+        self.created_at = enqueued_at if created_at is None else created_at
+
+    @property
+    def payload(self):
+        return self.buffer[:self.length]
+
+    @property
+    def size(self):
+        return self.length + FDDI_FRAME_OVERHEAD
+
+class FaultSchedule:
+    def __init__(self, events=None):
+        self.events = []
+        for at, node_id, action in events or []:
+            self.add_event(at, node_id, action)
+
+    def add_event(self, at, node_id, action):
+        if action not in ("fail", "recover"):
+            raise ValueError(f"Ação de falha inválida: {action}")
+        self.events.append((float(at), int(node_id), action))
+
+    def add_failure(self, node_id, at, duration):
+        self.add_event(at, node_id, "fail")
+        self.add_event(at + duration, node_id, "recover")
+
+    def __len__(self):
+        return len(self.events)
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls((e["time"], e["node"], e["action"]) for e in data)
+
+    def to_file(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([{"time": at, "node": node_id, "action": action}
+                       for at, node_id, action in self.events], f, indent=2)
+
+    @classmethod
+    def generate(cls, num_nodes, duration, seed=None, mtbf=1.0, mttr=0.1,
+                 correlation=0.0, flapping_nodes=(), flap_period=0.01):
+        if duration <= 0 or mtbf <= 0 or mttr <= 0 or flap_period <= 0:
+            raise ValueError("duration, mtbf, mttr e flap_period devem ser positivos")
+        if not 0 <= correlation <= 1:
+            raise ValueError("correlation deve estar entre 0 e 1")
+
+        rng = random.Random(seed)
+        intervals = {node_id: [] for node_id in range(num_nodes)}
+
+        for node_id in range(num_nodes):
+            t = rng.expovariate(1.0 / mtbf)
+            while t < duration:
+                repair = rng.expovariate(1.0 / mttr)
+                intervals[node_id].append((t, t + repair))
+                if correlation and rng.random() < correlation:
+                    neighbor = (node_id + 1) % num_nodes
+                    intervals[neighbor].append((t, t + repair))
+                t += repair + rng.expovariate(1.0 / mtbf)
+
+        for node_id in flapping_nodes:
+            t = rng.uniform(0, flap_period)
+            while t < duration:
+                intervals[node_id].append((t, t + flap_period / 2))
+                t += flap_period
+
+        schedule = cls()
+        for node_id, node_intervals in intervals.items():
+            node_intervals.sort()
+            merged = []
+            for start, end in node_intervals:
+                if merged and start <= merged[-1][1]:
+                    merged[-1][1] = max(merged[-1][1], end)
+                else:
+                    merged.append([start, end])
+            for start, end in merged:
+                schedule.add_failure(node_id, start, end - start)
+        schedule.events.sort()
+        return schedule
+
+class MessageProducer:
+    def __init__(self, simulator, node_id, destination=None, batch_size=256):
+        self.simulator = simulator
+        self.node_id = node_id
+        self.destination = destination
+        self.batch_size = batch_size
+        self.pending = []
+        self.sent = 0
+
+    def send(self, message):
+        self.pending.append(message)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            batch, self.pending = self.pending, []
+            self.sent += self.simulator.add_messages(self.node_id, batch, self.destination)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+
 class TokenRingNode:
     def __init__(self, node_id, next_node=None):
         self.node_id = node_id
         self.has_token = False
         self.next_node = next_node
-        self.message_queue = []
+        self.message_queue = deque()
+        self.bridge_queue = None
         self.is_failed = False
         self.transmission_count = 0
         self.last_transmission = None
-        self.received_messages = []
+        self.received_messages = deque(maxlen=MESSAGE_HISTORY)
+        self.bandwidth = DEFAULT_BANDWIDTH
+        self.propagation_delay = DEFAULT_PROPAGATION_DELAY
+        self.bytes_transmitted = 0
 
     def receive_token(self, simulator):
         if not simulator.is_running:
             return
             
         if self.is_failed:
-            simulator.log_event(f"Node {self.node_id} está falho. Pulando para o próximo.")
-            if self.next_node:
-                self.next_node.receive_token(simulator)
+            if simulator.on_log:
+                simulator.log_event(f"Node {self.node_id} está falho. Pulando para o próximo.")
+            simulator.sim_time += self.propagation_delay
             return
 
         self.has_token = True
-        simulator.log_event(f"Node {self.node_id} recebeu o token")
+        if simulator.on_log:
+            simulator.log_event(f"Node {self.node_id} recebeu o token")
+        if simulator.on_token_received:
+            simulator.on_token_received(self)
         simulator.update_gui()
 
+        if self.bridge_queue and simulator.is_running:
+            self.transmit(simulator, self.bridge_queue)
+
         if self.message_queue and simulator.is_running:
             self.transmit(simulator)
 
         if simulator.is_running:
-            time.sleep(simulator.transmission_delay)
+            if simulator.paced and simulator.transmission_delay:
+                time.sleep(simulator.transmission_delay)
             self.pass_token(simulator)
 
     def pass_token(self, simulator):
@@ -42,33 +271,88 @@ class TokenRingNode:
             return
             
         self.has_token = False
+        if simulator.current_holder == self.node_id:
+            simulator.current_holder = None
         if not self.is_failed and self.next_node and simulator.is_running:
-            simulator.log_event(f"Node {self.node_id} passou o token para Node {self.next_node.node_id}")
-            self.next_node.receive_token(simulator)
+            simulator.sim_time += FDDI_TOKEN_SIZE * 8 / self.bandwidth + self.propagation_delay
+            if simulator.on_log:
+                simulator.log_event(f"Node {self.node_id} passou o token para Node {self.next_node.node_id}")
+            if simulator.on_token_passed:
+                simulator.on_token_passed(self, self.next_node)
 
-    def transmit(self, simulator):
-        if self.has_token and self.message_queue and not self.is_failed and simulator.is_running:
-            message = self.message_queue.pop(0)
-            simulator.log_event(f"Node {self.node_id} transmitindo: '{message}'")
-            
+    def transmit(self, simulator, queue=None):
+        if queue is None:
+            queue = self.message_queue
+        if self.has_token and queue and not self.is_failed and simulator.is_running:
+            frame = queue.popleft()
+            simulator.frames_dequeued += 1
+            if simulator.on_log:
+                simulator.log_event(f"Node {self.node_id} transmitindo: '{frame.label}' ({frame.size} bytes)")
+
+            start = simulator.sim_time
+            tx_time = frame.size * 8 / self.bandwidth
+            if simulator.early_token_release:
+                simulator.sim_time += tx_time
+            else:
+                simulator.sim_time += tx_time + simulator.ring_latency()
             self.transmission_count += 1
-            self.last_transmission = datetime.now().strftime("%H:%M:%S")
-            self.received_messages.append(f"Transmitido: {message}")
+            simulator.total_transmissions += 1
+            self.bytes_transmitted += frame.size
+            if simulator.on_update:
+                self.last_transmission = datetime.now().strftime("%H:%M:%S")
+            self.received_messages.append(f"Transmitido: {frame.label}")
+            if simulator.on_transmit:
+                simulator.on_transmit(self, frame)
+            simulator.deliver_frame(frame, start + tx_time)
             simulator.update_gui()
 
-    def add_message(self, message, simulator):
+    def add_message(self, message, simulator, destination=None):
         if not self.is_failed:
-            self.message_queue.append(message)
-            simulator.log_event(f"Mensagem '{message}' adicionada à fila do Node {self.node_id}")
+            frames = simulator.build_frames(self.node_id, destination, message)
+            if simulator.on_log:
+                simulator.log_event(f"Mensagem '{frames[0].label}' adicionada à fila do Node {self.node_id} ({len(frames)} quadro(s))")
+            self.enqueue_frames(frames, simulator)
             return True
         else:
             simulator.log_event(f"Falha: Node {self.node_id} está inoperante")
             return False
 
+    def add_messages(self, messages, simulator, destination=None):
+        if self.is_failed:
+            simulator.log_event(f"Falha: Node {self.node_id} está inoperante")
+            return 0
+
+        count, frames = simulator.build_frame_batch(self.node_id, destination, messages)
+        if frames:
+            simulator.log_event(f"{count} mensagens adicionadas à fila do Node {self.node_id} ({len(frames)} quadro(s))")
+            self.enqueue_frames(frames, simulator)
+        return count
+
+    def enqueue_frames(self, frames, simulator, queue=None):
+        if queue is None:
+            queue = self.message_queue
+        queue.extend(frames)
+        simulator.count_enqueued(len(frames))
+        if simulator.on_enqueue:
+            simulator.on_enqueue(self, frames)
+
     def toggle_failure(self, simulator):
-        self.is_failed = not self.is_failed
+        self.set_failed(not self.is_failed, simulator)
+
+    def set_failed(self, failed, simulator):
+        if self.is_failed == failed:
+            return
+        self.is_failed = failed
+        simulator.active_nodes += -1 if failed else 1
+        if failed and simulator.current_holder == self.node_id:
+            self.has_token = False
+            simulator.current_holder = None
         status = "FALHOU" if self.is_failed else "RECUPERADO"
         simulator.log_event(f"Node {self.node_id} {status}")
+        simulator.record_failure_interval()
+        hook = simulator.on_failure if self.is_failed else simulator.on_recovery
+        if hook:
+            hook(self)
         simulator.update_gui()
 
 class TokenRingSimulator:
@@ -77,9 +361,34 @@ class TokenRingSimulator:
         self.is_running = False
         self.simulation_thread = None
         self.transmission_delay = 1.0
-        self.log_messages = []
+        self.hop_interval = 0.1
+        self.paced = False
+        self.log_messages = deque(maxlen=LOG_HISTORY)
         self._stop_event = threading.Event()
+        self.early_token_release = True
+        self.buffer_pool = BufferPool()
+        self.sim_time = 0.0
+        self.bytes_delivered = 0
+        self.frames_delivered = 0
+        self.total_frame_latency = 0.0
+        self.frames_lost = 0
+        self.total_transmissions = 0
+        self.active_nodes = 0
+        self.frames_enqueued = 0
+        self.frames_dequeued = 0
+        self.current_holder = None
+        self.rotations_completed = 0
+        self._stats_lock = threading.Lock()
+        self._timeline = []
+        self._timeline_seq = itertools.count()
+        self._current_index = 0
+        self._subscribers = {event: [] for event in HOOK_EVENTS}
+        self.profiler = None
+        for event in HOOK_EVENTS:
+            setattr(self, f"on_{event}", None)
+        self.failure_intervals = []
         self.create_ring(num_nodes)
+        self._interval_start = self._snapshot_interval()
 
     def create_ring(self, num_nodes):
         self.nodes = []
@@ -88,6 +397,9 @@ class TokenRingSimulator:
 
         for i in range(num_nodes):
             self.nodes[i].next_node = self.nodes[(i + 1) % num_nodes]
+        self.active_nodes = num_nodes
+        self.current_holder = None
+        self._last_holder = None
 
     def start_simulation(self):
         if not self.nodes:
@@ -102,42 +414,79 @@ class TokenRingSimulator:
         self._stop_event.clear()
         self.log_event("=== INICIANDO SIMULAÇÃO TOKEN RING ===")
         
+        self._current_index = 0
+        self._last_holder = None
+        
         def run_simulation():
-            current_node_index = 0
+            self.paced = True
             while self.is_running and not self._stop_event.is_set():
                 try:
-                    start_index = current_node_index
-                    while True:
-                        node = self.nodes[current_node_index]
-                        if not node.is_failed and self.is_running:
-                            break
-                        current_node_index = (current_node_index + 1) % len(self.nodes)
-                        if current_node_index == start_index:
-                            time.sleep(0.5)
-                            continue
-                    
-                    for n in self.nodes:
-                        n.has_token = False
-                    
-                    node.has_token = True
-                    self.update_gui()
-                    node.receive_token(self)
-                    
-                    current_node_index = (current_node_index + 1) % len(self.nodes)
-                    
-                    time.sleep(0.1)
+                    if not self.step():
+                        time.sleep(0.5)
+                    elif self.hop_interval:
+                        time.sleep(self.hop_interval)
                     
                 except Exception as e:
                     self.log_event(f"Erro na simulação: {str(e)}")
                     break
                     
             self.is_running = False
+            self.paced = False
+            self.current_holder = None
             self.log_event("=== SIMULAÇÃO FINALIZADA ===")
 
         self.simulation_thread = threading.Thread(target=run_simulation)
         self.simulation_thread.daemon = True
         self.simulation_thread.start()
 
+    def step(self, until=None):
+        if self._timeline and self._timeline[0][0] <= self.sim_time:
+            self.run_due_events()
+
+        start_index = self._current_index
+        while True:
+            node = self.nodes[self._current_index]
+            if not node.is_failed and self.is_running:
+                break
+            self.sim_time += node.propagation_delay
+            self._current_index = (self._current_index + 1) % len(self.nodes)
+            if self._current_index == start_index:
+                if not self.is_running:
+                    return False
+                if self._timeline and (until is None or self._timeline[0][0] < until):
+                    self.sim_time = max(self.sim_time, self._timeline[0][0])
+                    self.run_due_events()
+                    continue
+                return False
+
+        if self._last_holder is not None:
+            self.nodes[self._last_holder].has_token = False
+            if node.node_id <= self._last_holder:
+                self.rotations_completed += 1
+        self._last_holder = node.node_id
+
+        node.has_token = True
+        self.current_holder = node.node_id
+        self.update_gui()
+        node.receive_token(self)
+
+        self._current_index = (self._current_index + 1) % len(self.nodes)
+        return True
+
+    def run_until(self, end_time):
+        if not self.nodes:
+            return
+        was_running, was_paced = self.is_running, self.paced
+        self.is_running = True
+        self.paced = False
+        try:
+            while self.sim_time < end_time:
+                if not self.step(end_time):
+                    self.sim_time = end_time
+        finally:
+            self.is_running = was_running
+            self.paced = was_paced
+
     def stop_simulation(self):
         self.log_event("=== SOLICITANDO PARADA DA SIMULAÇÃO ===")
         self.is_running = False
@@ -145,37 +494,287 @@ class TokenRingSimulator:
         
         for node in self.nodes:
             node.has_token = False
+        self.current_holder = None
             
         self.update_gui()
 
-    def add_message_to_node(self, node_id, message):
+    def add_message_to_node(self, node_id, message, destination=None):
         if 0 <= node_id < len(self.nodes):
-            return self.nodes[node_id].add_message(message, self)
+            return self.nodes[node_id].add_message(message, self, destination)
         else:
             self.log_event(f"Erro: Node {node_id} não existe")
             return False
 
+    def add_messages(self, node_id, messages, destination=None):
+        if 0 <= node_id < len(self.nodes):
+            return self.nodes[node_id].add_messages(messages, self, destination)
+        else:
+            self.log_event(f"Erro: Node {node_id} não existe")
+            return 0
+
+    def create_producer(self, node_id, destination=None, batch_size=256):
+        return MessageProducer(self, node_id, destination, batch_size)
+
+    async def feed_messages(self, node_id, source, destination=None, batch_size=256):
+        with self.create_producer(node_id, destination, batch_size) as producer:
+            async for message in source:
+                producer.send(message)
+        return producer.sent
+
+    def set_link(self, node_id, bandwidth=None, propagation_delay=None):
+        if 0 <= node_id < len(self.nodes):
+            node = self.nodes[node_id]
+            if bandwidth is not None:
+                node.bandwidth = bandwidth
+            if propagation_delay is not None:
+                node.propagation_delay = propagation_delay
+            return True
+        self.log_event(f"Erro: Node {node_id} não existe")
+        return False
+
+    def ring_latency(self):
+        return sum(node.propagation_delay for node in self.nodes)
+
+    def max_step_time(self):
+        ring_latency = self.ring_latency()
+        longest = 0.0
+        for node in self.nodes:
+            frames = 1 if node.bridge_queue is None else 2
+            frame_time = FDDI_MAX_FRAME_SIZE * 8 / node.bandwidth
+            if not self.early_token_release:
+                frame_time += ring_latency
+            token_time = FDDI_TOKEN_SIZE * 8 / node.bandwidth + node.propagation_delay
+            longest = max(longest, frames * frame_time + token_time)
+        return longest + ring_latency
+
+    def build_frames(self, source, destination, message):
+        if isinstance(message, str):
+            label = message
+            data = memoryview(message.encode("utf-8"))
+        else:
+            data = memoryview(message).cast("B")
+            label = f"<{len(data)} bytes>"
+
+        if len(data) <= FDDI_MAX_PAYLOAD:
+            buffer = self.buffer_pool.acquire(len(data))
+            buffer[:len(data)] = data
+            return [Frame(source, destination, buffer, len(data), label, self.sim_time)]
+
+        frames = []
+        offset = 0
+        while True:
+            length = min(len(data) - offset, FDDI_MAX_PAYLOAD)
+            buffer = self.buffer_pool.acquire(length)
+            buffer[:length] = data[offset:offset + length]
+            frames.append(Frame(source, destination, buffer, length, label, self.sim_time))
+            offset += length
+            if offset >= len(data):
+                return frames
+
+    def build_frame_batch(self, source, destination, messages):
+        small = []
+        frames = []
+        count = 0
+        for message in messages:
+            count += 1
+            if isinstance(message, str):
+                data = message.encode("utf-8")
+                label = message
+            else:
+                data = memoryview(message).cast("B")
+                label = f"<{len(data)} bytes>"
+            if len(data) > FDDI_MAX_PAYLOAD:
+                if small:
+                    frames.extend(self._fill_frames(source, destination, small))
+                    small = []
+                frames.extend(self.build_frames(source, destination, message))
+            else:
+                small.append((data, label))
+        if small:
+            frames.extend(self._fill_frames(source, destination, small))
+        return count, frames
+
+    def _fill_frames(self, source, destination, items):
+        buffers = self.buffer_pool.acquire_many([len(data) for data, _ in items])
+        now = self.sim_time
+        frames = []
+        for buffer, (data, label) in zip(buffers, items):
+            length = len(data)
+            buffer[:length] = data
+            frames.append(Frame(source, destination, buffer, length, label, now))
+        return frames
+
+    def deliver_frame(self, frame, sent_at):
+        if frame.destination is not None and 0 <= frame.destination < len(self.nodes):
+            if self.nodes[frame.destination].is_failed:
+                self.frames_lost += 1
+                self.buffer_pool.release(frame.buffer)
+                return
+            hops = (frame.destination - frame.source) % len(self.nodes) or len(self.nodes)
+            arrival = sent_at
+            node = self.nodes[frame.source]
+            for _ in range(hops):
+                arrival += node.propagation_delay
+                node = node.next_node
+            self.nodes[frame.destination].received_messages.append(
+                f"Recebido de Node {frame.source}: {frame.label}")
+        else:
+            arrival = sent_at + self.ring_latency()
+
+        if self.on_deliver:
+            self.on_deliver(frame, arrival)
+        self.bytes_delivered += frame.length
+        self.frames_delivered += 1
+        self.total_frame_latency += arrival - frame.enqueued_at
+        self.buffer_pool.release(frame.buffer)
+
+    def get_throughput(self):
+        if self.sim_time <= 0:
+            return 0.0
+        return self.bytes_delivered * 8 / self.sim_time
+
+    def get_average_latency(self):
+        if not self.frames_delivered:
+            return 0.0
+        return self.total_frame_latency / self.frames_delivered
+
     def toggle_node_failure(self, node_id):
         if 0 <= node_id < len(self.nodes):
             self.nodes[node_id].toggle_failure(self)
 
+    def set_node_failure(self, node_id, failed):
+        if 0 <= node_id < len(self.nodes):
+            self.nodes[node_id].set_failed(failed, self)
+
+    def schedule_event(self, at, callback, *args):
+        heapq.heappush(self._timeline, (at, next(self._timeline_seq), callback, args))
+
+    def run_due_events(self):
+        while self._timeline and self._timeline[0][0] <= self.sim_time:
+            _, _, callback, args = heapq.heappop(self._timeline)
+            callback(*args)
+
+    def load_fault_schedule(self, schedule):
+        for at, node_id, action in schedule.events:
+            self.schedule_event(at, self.set_node_failure, node_id, action == "fail")
+        self.log_event(f"Agenda de falhas carregada: {len(schedule)} eventos")
+
+    def _snapshot_interval(self):
+        failed = tuple(node.node_id for node in self.nodes if node.is_failed)
+        return (self.sim_time, self.bytes_delivered, self.frames_delivered,
+                self.total_frame_latency, self.frames_lost, failed)
+
+    def _close_interval(self, start, end):
+        start_time, start_bytes, start_frames, start_latency, start_lost, failed = start
+        end_time, end_bytes, end_frames, end_latency, end_lost, _ = end
+        elapsed = end_time - start_time
+        frames = end_frames - start_frames
+        return {
+            'start': start_time,
+            'end': end_time,
+            'failed_nodes': failed,
+            'frames': frames,
+            'frames_lost': end_lost - start_lost,
+            'throughput': (end_bytes - start_bytes) * 8 / elapsed if elapsed > 0 else 0.0,
+            'avg_latency': (end_latency - start_latency) / frames if frames else 0.0,
+        }
+
+    def record_failure_interval(self):
+        now = self._snapshot_interval()
+        if now[0] > self._interval_start[0]:
+            self.failure_intervals.append(self._close_interval(self._interval_start, now))
+        self._interval_start = now
+
+    def get_failure_report(self):
+        intervals = list(self.failure_intervals)
+        if self.sim_time > self._interval_start[0]:
+            intervals.append(self._close_interval(self._interval_start, self._snapshot_interval()))
+
+        healthy = [i for i in intervals if not i['failed_nodes']]
+        healthy_time = sum(i['end'] - i['start'] for i in healthy)
+        healthy_frames = sum(i['frames'] for i in healthy)
+        baseline_throughput = (sum(i['throughput'] * (i['end'] - i['start']) for i in healthy) / healthy_time
+                               if healthy_time > 0 else self.get_throughput())
+        baseline_latency = (sum(i['avg_latency'] * i['frames'] for i in healthy) / healthy_frames
+                            if healthy_frames else self.get_average_latency())
+
+        for interval in intervals:
+            interval['throughput_degradation'] = (1 - interval['throughput'] / baseline_throughput
+                                                  if baseline_throughput else 0.0)
+            interval['latency_increase'] = (interval['avg_latency'] - baseline_latency
+                                            if interval['frames'] else 0.0)
+        return intervals
+
+    def subscribe(self, event, callback):
+        if event not in self._subscribers:
+            raise ValueError(f"Evento desconhecido: {event}")
+        self._subscribers[event].append(callback)
+        self._rebuild_hook(event)
+        return callback
+
+    def unsubscribe(self, event, callback):
+        if event in self._subscribers and callback in self._subscribers[event]:
+            self._subscribers[event].remove(callback)
+            self._rebuild_hook(event)
+
+    def enable_profiling(self, profiler=None):
+        self.profiler = profiler or HookProfiler()
+        for event in HOOK_EVENTS:
+            self._rebuild_hook(event)
+        return self.profiler
+
+    def disable_profiling(self):
+        self.profiler = None
+        for event in HOOK_EVENTS:
+            self._rebuild_hook(event)
+
+    def _rebuild_hook(self, event):
+        callbacks = self._subscribers[event]
+        if self.profiler:
+            callbacks = [self.profiler.wrap(event, callback) for callback in callbacks]
+        else:
+            callbacks = list(callbacks)
+
+        if not callbacks:
+            hook = None
+        elif len(callbacks) == 1:
+            hook = callbacks[0]
+        else:
+            def hook(*args):
+                for callback in callbacks:
+                    callback(*args)
+        setattr(self, f"on_{event}", hook)
+
+    def keep_log_history(self):
+        self.subscribe("log", self.log_messages.append)
+
     def log_event(self, message):
+        if not self.on_log:
+            return
         timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
-        self.log_messages.append(log_entry)
-        if hasattr(self, 'log_text'):
-            try:
-                self.log_text.insert(tk.END, log_entry + "\n")
-                self.log_text.see(tk.END)
-            except tk.TclError:
-                pass
+        self.on_log(f"[{timestamp}] {message}")
 
     def update_gui(self):
-        if hasattr(self, 'update_display'):
-            try:
-                self.update_display()
-            except:
-                pass
+        if self.on_update:
+            self.on_update()
+
+    def count_enqueued(self, count):
+        with self._stats_lock:
+            self.frames_enqueued += count
+
+    def get_system_stats(self):
+        return {
+            'total_transmissions': self.total_transmissions,
+            'active_nodes': self.active_nodes,
+            'total_nodes': len(self.nodes),
+            'total_queued': self.frames_enqueued - self.frames_dequeued,
+            'current_holder': self.current_holder,
+            'rotations_completed': self.rotations_completed,
+            'frames_lost': self.frames_lost,
+            'is_running': self.is_running,
+            'sim_time': self.sim_time,
+            'throughput': self.get_throughput(),
+        }
 
     def get_node_status(self, node_id):
         if 0 <= node_id < len(self.nodes):
@@ -186,6 +785,244 @@ class TokenRingSimulator:
             return status, token, queue_size, node.transmission_count, node.last_transmission
         return "INEXISTENTE", "", 0, 0, ""
 
+class Bridge:
+    def __init__(self, ring_a, node_a, ring_b, node_b, delay=DEFAULT_BRIDGE_DELAY):
+        self.ports = {ring_a: node_a, ring_b: node_b}
+        self.delay = delay
+        self.forwarded = {ring_a: 0, ring_b: 0}
+        self.in_flight = {ring_a: 0, ring_b: 0}
+        self.queues = {ring_a: deque(), ring_b: deque()}
+        self.occupancy = {ring_a: [0, 0, 0], ring_b: [0, 0, 0]}
+
+    def other(self, ring_id):
+        for ring in self.ports:
+            if ring != ring_id:
+                return ring
+
+    def sample_occupancy(self, ring_id, queued):
+        record = self.occupancy[ring_id]
+        record[0] += 1
+        record[1] += queued
+        record[2] = max(record[2], queued)
+
+    def report(self):
+        rings = tuple(self.ports)
+        return {
+            'rings': rings,
+            'ports': dict(self.ports),
+            'forwarded': dict(self.forwarded),
+            'avg_occupancy': {ring: (total / samples if samples else 0.0)
+                              for ring, (samples, total, _) in self.occupancy.items()},
+            'max_occupancy': {ring: peak for ring, (_, _, peak) in self.occupancy.items()},
+        }
+
+class BridgedTopology:
+    def __init__(self, window=None):
+        self.rings = []
+        self.bridges = []
+        self.window = window
+        self._routes = {}
+        self._outbox = []
+        self._latency = []
+        self._barrier = None
+        self._epoch_end = None
+        self._stop_at = 0.0
+        self._error = None
+
+    @classmethod
+    def chain(cls, num_rings, nodes_per_ring=4, delay=DEFAULT_BRIDGE_DELAY, window=None):
+        if num_rings > 2 and nodes_per_ring < 2:
+            raise ValueError("Uma cadeia com mais de dois anéis precisa de pelo menos 2 nós por anel "
+                             "(uma porta para cada ponte)")
+        topology = cls(window)
+        for _ in range(num_rings):
+            topology.add_ring(nodes_per_ring)
+        for i in range(num_rings - 1):
+            topology.add_bridge(i, nodes_per_ring - 1, i + 1, 0, delay)
+        return topology
+
+    def add_ring(self, num_nodes=4):
+        ring = TokenRingSimulator(num_nodes)
+        ring_id = len(self.rings)
+        self.rings.append(ring)
+        self._outbox.append([])
+        self._latency.append([0, 0.0, 0.0])
+        ring.subscribe("deliver", lambda frame, arrival: self._on_deliver(ring_id, frame, arrival))
+        return ring_id
+
+    def add_bridge(self, ring_a, node_a, ring_b, node_b, delay=DEFAULT_BRIDGE_DELAY):
+        if ring_a == ring_b:
+            raise ValueError("Uma ponte deve ligar dois anéis distintos")
+        if delay <= 0:
+            raise ValueError("O atraso da ponte deve ser positivo")
+        for ring_id, node_id in ((ring_a, node_a), (ring_b, node_b)):
+            if not (0 <= ring_id < len(self.rings) and 0 <= node_id < len(self.rings[ring_id].nodes)):
+                raise ValueError(f"Anel {ring_id} / Node {node_id} não existe")
+            if self.rings[ring_id].nodes[node_id].bridge_queue is not None:
+                raise ValueError(f"Anel {ring_id} / Node {node_id} já é porta de outra ponte")
+        bridge = Bridge(ring_a, node_a, ring_b, node_b, delay)
+        for ring_id, node_id in bridge.ports.items():
+            self.rings[ring_id].nodes[node_id].bridge_queue = bridge.queues[ring_id]
+        self.bridges.append(bridge)
+        self._routes.clear()
+        return bridge
+
+    def _route(self, src_ring, dst_ring):
+        key = (src_ring, dst_ring)
+        if key not in self._routes:
+            first_hop = {src_ring: None}
+            pending = deque([src_ring])
+            while pending and dst_ring not in first_hop:
+                ring_id = pending.popleft()
+                for bridge in self.bridges:
+                    if ring_id in bridge.ports:
+                        neighbor = bridge.other(ring_id)
+                        if neighbor not in first_hop:
+                            first_hop[neighbor] = first_hop[ring_id] or bridge
+                            pending.append(neighbor)
+            self._routes[key] = first_hop.get(dst_ring)
+        return self._routes[key]
+
+    def send(self, src_ring, src_node, dst_ring, dst_node, message):
+        ring = self.rings[src_ring]
+        if src_ring == dst_ring:
+            return ring.add_message_to_node(src_node, message, dst_node)
+        if not 0 <= src_node < len(ring.nodes):
+            ring.log_event(f"Erro: Node {src_node} não existe")
+            return False
+        if not (0 <= dst_ring < len(self.rings) and 0 <= dst_node < len(self.rings[dst_ring].nodes)):
+            ring.log_event(f"Erro: Anel {dst_ring} / Node {dst_node} não existe")
+            return False
+
+        bridge = self._route(src_ring, dst_ring)
+        if bridge is None:
+            ring.log_event(f"Erro: Anel {dst_ring} inalcançável a partir do Anel {src_ring}")
+            return False
+
+        node = ring.nodes[src_node]
+        if node.is_failed:
+            ring.log_event(f"Falha: Node {src_node} está inoperante")
+            return False
+
+        frames = ring.build_frames(src_node, bridge.ports[src_ring], message)
+        for frame in frames:
+            frame.final = (dst_ring, dst_node)
+        if ring.on_log:
+            ring.log_event(f"Mensagem '{frames[0].label}' do Node {src_node} para Anel {dst_ring} / Node {dst_node}")
+        node.enqueue_frames(frames, ring)
+        return True
+
+    def _on_deliver(self, ring_id, frame, arrival):
+        if frame.final is None:
+            return
+        dst_ring, dst_node = frame.final
+        if dst_ring == ring_id:
+            if frame.destination == dst_node:
+                record = self._latency[ring_id]
+                latency = arrival - frame.created_at
+                record[0] += 1
+                record[1] += latency
+                record[2] = max(record[2], latency)
+            return
+
+        bridge = self._route(ring_id, dst_ring)
+        if bridge is None or frame.destination != bridge.ports[ring_id]:
+            return
+        target_id = bridge.other(ring_id)
+        target = self.rings[target_id]
+        next_hop = dst_node if target_id == dst_ring else self._route(target_id, dst_ring).ports[target_id]
+        at = arrival + bridge.delay
+
+        frames = target.build_frames(bridge.ports[target_id], next_hop, frame.payload)
+        for forwarded in frames:
+            forwarded.label = frame.label
+            forwarded.final = frame.final
+            forwarded.created_at = frame.created_at
+            forwarded.enqueued_at = at
+        bridge.forwarded[ring_id] += len(frames)
+        self._outbox[ring_id].append((bridge, target_id, at, frames))
+
+    def _inject(self, bridge, ring_id, frames):
+        ring = self.rings[ring_id]
+        bridge.in_flight[ring_id] -= len(frames)
+        ring.nodes[bridge.ports[ring_id]].enqueue_frames(frames, ring, bridge.queues[ring_id])
+
+    def _exchange(self):
+        for outbox in self._outbox:
+            for bridge, target_id, at, frames in outbox:
+                bridge.in_flight[target_id] += len(frames)
+                self.rings[target_id].schedule_event(at, self._inject, bridge, target_id, frames)
+            outbox.clear()
+
+        for bridge in self.bridges:
+            for ring_id, queue in bridge.queues.items():
+                bridge.sample_occupancy(ring_id, len(queue) + bridge.in_flight[ring_id])
+
+        if self._epoch_end >= self._stop_at:
+            self._epoch_end = None
+        else:
+            self._epoch_end = min(self._epoch_end + self._window, self._stop_at)
+
+    def _worker(self, ring):
+        try:
+            while self._epoch_end is not None:
+                ring.run_until(self._epoch_end)
+                self._barrier.wait()
+        except threading.BrokenBarrierError:
+            return
+        except Exception as e:
+            ring.log_event(f"Erro na simulação: {str(e)}")
+            if self._error is None:
+                self._error = e
+            self._barrier.abort()
+
+    def run(self, duration):
+        if not self.rings or duration <= 0:
+            return self.get_report()
+
+        step_times = [ring.max_step_time() for ring in self.rings]
+        lookahead = min((bridge.delay - step_times[ring_id]
+                         for bridge in self.bridges for ring_id in bridge.ports), default=None)
+        if lookahead is not None and lookahead <= 0:
+            raise ValueError("O atraso de cada ponte deve exceder o passo mais longo do anel de destino "
+                             f"({max(step_times):.6f} s)")
+        if self.window is not None:
+            window = self.window
+        else:
+            window = lookahead if lookahead is not None else duration
+        if window <= 0:
+            raise ValueError("A janela de sincronização deve ser positiva")
+        if lookahead is not None and window > lookahead:
+            raise ValueError(f"A janela de sincronização ({window}) excede a antecipação segura ({lookahead})")
+        start = min(ring.sim_time for ring in self.rings)
+        self._window = window
+        self._stop_at = start + duration
+        self._epoch_end = min(start + window, self._stop_at)
+        self._barrier = threading.Barrier(len(self.rings), action=self._exchange)
+        self._error = None
+
+        workers = [threading.Thread(target=self._worker, args=(ring,), daemon=True)
+                   for ring in self.rings]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+        return self.get_report()
+
+    def get_report(self):
+        count = sum(record[0] for record in self._latency)
+        total = sum(record[1] for record in self._latency)
+        return {
+            'cross_ring_frames': count,
+            'cross_ring_avg_latency': total / count if count else 0.0,
+            'cross_ring_max_latency': max((record[2] for record in self._latency), default=0.0),
+            'bridges': [bridge.report() for bridge in self.bridges],
+            'rings': [ring.get_system_stats() for ring in self.rings],
+        }
+
 class TokenRingGUI:
     def __init__(self, root):
         self.root = root
@@ -193,11 +1030,29 @@ class TokenRingGUI:
         self.root.geometry("1200x800")
         
         self.simulator = TokenRingSimulator(4)
-        self.simulator.update_display = self.update_display
         
         self.setup_gui()
+        self.attach_simulator()
         self.update_display()
 
+    def attach_simulator(self):
+        self.simulator.keep_log_history()
+        self.simulator.subscribe("log", self.append_log)
+        self.simulator.subscribe("update", self.refresh_display)
+
+    def append_log(self, log_entry):
+        try:
+            self.log_text.insert(tk.END, log_entry + "\n")
+            self.log_text.see(tk.END)
+        except tk.TclError:
+            pass
+
+    def refresh_display(self):
+        try:
+            self.update_display()
+        except tk.TclError:
+            pass
+
     def setup_gui(self):
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -300,7 +1155,6 @@ class TokenRingGUI:
 
         self.log_text = scrolledtext.ScrolledText(log_frame, width=60, height=25)
         self.log_text.pack(fill=tk.BOTH, expand=True)
-        self.simulator.log_text = self.log_text
 
         stats_frame = ttk.LabelFrame(right_frame, text="Estatísticas do Sistema", padding="10")
         stats_frame.pack(fill=tk.X, pady=(10, 0))
@@ -309,14 +1163,13 @@ class TokenRingGUI:
         self.stats_label.pack(anchor=tk.W)
 
     def update_display(self):
-        total_transmissions = 0
-        active_nodes = 0
+        stats = self.simulator.get_system_stats()
         
         for i in range(4):
             status, token, queue_size, transmissions, last_trans = self.simulator.get_node_status(i)
             
-            color = 'red' if status == "FALHO" else 'green'
-            if token == "COM TOKEN":
+            color = 'red' if self.simulator.nodes[i].is_failed else 'green'
+            if stats['current_holder'] == i:
                 color = 'yellow'
             
             self.node_frames[i]['canvas'].config(bg=color)
@@ -325,15 +1178,12 @@ class TokenRingGUI:
             self.node_frames[i]['queue'].config(text=f"Fila: {queue_size} mensagens")
             last_display = last_trans if last_trans else "N/A"
             self.node_frames[i]['stats'].config(text=f"Transmissões: {transmissions} | Última: {last_display}")
-            
-            total_transmissions += transmissions
-            if status == "OPERACIONAL":
-                active_nodes += 1
         
-        status_text = "Executando" if self.simulator.is_running else "Parado"
-        self.stats_label.config(text=f"Total de Transmissões: {total_transmissions} | Nós Ativos: {active_nodes}/4 | Status: {status_text}")
+        status_text = "Executando" if stats['is_running'] else "Parado"
+        throughput = stats['throughput'] / 1e6
+        self.stats_label.config(text=f"Total de Transmissões: {stats['total_transmissions']} | Nós Ativos: {stats['active_nodes']}/{stats['total_nodes']} | Fila: {stats['total_queued']} | Rotações: {stats['rotations_completed']} | Vazão: {throughput:.2f} Mbps | Status: {status_text}")
         
-        self.status_indicator.config(bg='green' if self.simulator.is_running else 'red')
+        self.status_indicator.config(bg='green' if stats['is_running'] else 'red')
 
     def start_simulation(self):
         self.simulator.start_simulation()
@@ -350,8 +1200,7 @@ class TokenRingGUI:
         self.simulator.stop_simulation()
         time.sleep(0.5)
         self.simulator = TokenRingSimulator(4)
-        self.simulator.update_display = self.update_display
-        self.simulator.log_text = self.log_text
+        self.attach_simulator()
         self.update_display()
         self.simulator.log_event("=== ANEL REINICIADO ===")
         self.start_btn.config(state=tk.NORMAL)
@@ -415,10 +1264,12 @@ class TokenRingGUI:
             self.simulator.add_message_to_node(i, message)
 
     def stress_test(self):
+        batches = {}
         for i in range(10):
             node_id = random.randint(0, 3)
-            message = f"Teste estresse #{i+1}"
-            self.simulator.add_message_to_node(node_id, message)
+            batches.setdefault(node_id, []).append(f"Teste estresse #{i+1}")
+        for node_id, messages in batches.items():
+            self.simulator.add_messages(node_id, messages)
 
     def show_messages(self, node_id):
         node = self.simulator.nodes[node_id]
@@ -431,7 +1282,7 @@ class TokenRingGUI:
         text_widget = scrolledtext.ScrolledText(dialog, width=50, height=15)
         text_widget.pack(padx=10, pady=5, fill=tk.BOTH, expand=True)
         
-        for msg in node.received_messages[-20:]:
+        for msg in node.received_messages:
             text_widget.insert(tk.END, f"{msg}\n")
         
         text_widget.config(state=tk.DISABLED)
@@ -0,0 +1,108 @@
+import pytest
+
+from entrega04 import BridgedTopology
+
+
+def instrument(topology):
+    trace = {ring_id: [] for ring_id in range(len(topology.rings))}
+    scheduled_in_past = []
+
+    for ring_id, ring in enumerate(topology.rings):
+        schedule_event = ring.schedule_event
+
+        def checked(at, callback, *args, ring=ring, ring_id=ring_id, schedule_event=schedule_event):
+            if at < ring.sim_time:
+                scheduled_in_past.append((ring_id, at, ring.sim_time))
+
+            def injected(*inner):
+                trace[ring_id].append(('inject', at, ring.sim_time))
+                return callback(*inner)
+            schedule_event(at, injected, *args)
+
+        ring.schedule_event = checked
+        ring.subscribe("token_received",
+                       lambda node, ring=ring, ring_id=ring_id:
+                       trace[ring_id].append(('capture', node.node_id, ring.sim_time)))
+    return trace, scheduled_in_past
+
+
+def late_injections(topology, trace):
+    late = []
+    for bridge in topology.bridges:
+        for ring_id, port in bridge.ports.items():
+            captures = []
+            for entry in trace[ring_id]:
+                if entry[0] == 'capture' and entry[1] == port:
+                    captures.append(entry[2])
+                elif entry[0] == 'inject' and captures and captures[-1] >= entry[1]:
+                    late.append((ring_id, entry[1], captures[-1]))
+    return late
+
+
+def test_forwarded_frames_never_land_in_target_ring_past():
+    topology = BridgedTopology.chain(2)
+    for _ in range(50):
+        topology.send(0, 1, 1, 2, b"x" * 4400)
+        topology.rings[1].add_message_to_node(0, b"y" * 4400, 2)
+    trace, scheduled_in_past = instrument(topology)
+
+    report = topology.run(0.1)
+
+    assert scheduled_in_past == []
+    assert late_injections(topology, trace) == []
+    assert report['cross_ring_frames'] == 50
+
+
+def test_chain_delivers_every_cross_ring_frame_on_time():
+    topology = BridgedTopology.chain(3)
+    sent = 0
+    for src_ring, dst_ring in ((0, 2), (2, 0), (0, 1), (1, 2)):
+        for _ in range(20):
+            assert topology.send(src_ring, 1, dst_ring, 2, b"z" * 1500)
+            sent += 1
+    trace, scheduled_in_past = instrument(topology)
+
+    report = topology.run(0.2)
+
+    assert report['cross_ring_frames'] == sent
+    assert scheduled_in_past == []
+    assert late_injections(topology, trace) == []
+    assert all(ring['total_queued'] == 0 for ring in report['rings'])
+    assert report['bridges'][0]['forwarded'] == {0: 40, 1: 20}
+    assert report['bridges'][1]['forwarded'] == {1: 40, 2: 20}
+
+
+def test_bridge_occupancy_ignores_port_node_local_traffic():
+    topology = BridgedTopology.chain(2)
+    port = topology.bridges[0].ports[0]
+    topology.rings[0].add_messages(port, [b"l" * 1500] * 200, destination=1)
+
+    report = topology.run(0.05)
+
+    assert report['bridges'][0]['max_occupancy'] == {0: 0, 1: 0}
+    assert topology.rings[0].frames_delivered == 200
+
+
+def test_ring_errors_propagate_from_run():
+    topology = BridgedTopology.chain(2)
+
+    def failing_subscriber(node, frame):
+        raise RuntimeError("falha no assinante")
+    topology.rings[1].subscribe("transmit", failing_subscriber)
+    topology.send(0, 1, 1, 2, "oi")
+
+    with pytest.raises(RuntimeError, match="falha no assinante"):
+        topology.run(0.01)
+
+
+def test_lookahead_must_be_positive():
+    with pytest.raises(ValueError):
+        BridgedTopology.chain(2, delay=0)
+    with pytest.raises(ValueError):
+        BridgedTopology.chain(2, delay=100e-6).run(0.01)
+    with pytest.raises(ValueError):
+        BridgedTopology.chain(2, window=0).run(0.01)
+    with pytest.raises(ValueError):
+        BridgedTopology.chain(2, window=1e-3).run(0.01)
+    with pytest.raises(ValueError):
+        BridgedTopology.chain(3, nodes_per_ring=1)